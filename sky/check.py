@@ -1,7 +1,12 @@
 """Credential checks: check cloud credentials and enable clouds."""
 import collections
+import contextvars
+import hashlib
+import json
+import operator
 import os
-import traceback
+import tempfile
+import time
 from types import ModuleType
 from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 
@@ -17,7 +22,9 @@ from sky.adaptors import cloudflare
 from sky.adaptors import coreweave
 from sky.clouds import cloud as sky_cloud
 from sky.skylet import constants
+from sky.utils import annotations
 from sky.utils import common_utils
+from sky.utils import env_options
 from sky.utils import registry
 from sky.utils import rich_utils
 from sky.utils import subprocess_utils
@@ -26,16 +33,184 @@ from sky.utils import ux_utils
 CHECK_MARK_EMOJI = '\U00002714'  # Heavy check mark unicode
 PARTY_POPPER_EMOJI = '\U0001F389'  # Party popper unicode
 
+# Color escape codes used to format the check results.
+_YELLOW = colorama.Fore.LIGHTYELLOW_EX
+_GREEN = colorama.Fore.GREEN
+_RED = colorama.Fore.LIGHTRED_EX
+_BRIGHT = colorama.Style.BRIGHT
+_NORMAL = colorama.Style.NORMAL
+_DIM = colorama.Style.DIM
+_RESET_ALL = colorama.Style.RESET_ALL
+
 logger = sky_logging.init_logger(__name__)
 
+# (capability, ok, reason or per-context status) of one credential check.
+_CheckResult = Tuple[sky_cloud.CloudCapability, bool,
+                     Optional[Union[str, Dict[str, str]]]]
+
+# On-disk cache of credential check results, with one file per cloud,
+# capability and workspace. Each file stores the key it was written with, see
+# _credential_check_cache_key.
+_CREDENTIAL_CHECK_CACHE_DIR = '~/.sky/.cache/credcheck'
+_CREDENTIAL_CHECK_CACHE_TTL_SECONDS = 300
+# Prefixes of the env vars that select a cloud identity, e.g. AWS_PROFILE or
+# GOOGLE_APPLICATION_CREDENTIALS. An identity change that touches neither
+# these nor the credential files (e.g. an expired SSO session) is only picked
+# up once the cached result expires.
+_CREDENTIAL_ENV_VAR_PREFIXES = ('AWS_', 'AZURE_', 'CLOUDSDK_', 'GOOGLE_',
+                                'OCI_')
+
+# Maximum number of threads used to query the clouds in parallel.
+_MAX_CREDENTIAL_CHECK_THREADS = 32
+
+
+def _credential_check_cache_path(cloud_repr: str,
+                                 capability: sky_cloud.CloudCapability,
+                                 workspace: str) -> str:
+    # Workspace names are not restricted to the characters allowed in file
+    # names, so use a hash of the name instead.
+    workspace_hash = hashlib.sha256(workspace.encode()).hexdigest()[:8]
+    return os.path.join(
+        os.path.expanduser(_CREDENTIAL_CHECK_CACHE_DIR),
+        f'{cloud_repr}-{capability.value}-{workspace_hash}.json')
+
+
+def _credential_check_cache_key(cloud: Union[sky_clouds.Cloud, ModuleType],
+                                config_repr: str) -> str:
+    """Returns the key that a cached result for the cloud must match.
+
+    The key is a hash of the SkyPilot config, the credential env vars and the
+    mtimes of the cloud's credential files, so that any change to them
+    invalidates the cached result.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(config_repr.encode())
+    for name in sorted(os.environ):
+        if name.startswith(_CREDENTIAL_ENV_VAR_PREFIXES):
+            hasher.update(f'{name}={os.environ[name]}\0'.encode())
+    try:
+        credential_files = cloud.get_credential_file_mounts().values()
+    except Exception:  # pylint: disable=broad-except
+        credential_files = []
+    for path in sorted(credential_files):
+        try:
+            mtime_ns = os.stat(os.path.expanduser(path)).st_mtime_ns
+        except OSError:
+            mtime_ns = -1
+        hasher.update(f'{path}:{mtime_ns}\0'.encode())
+    return hasher.hexdigest()[:16]
+
+
+def _get_credential_check_cache_keys(cloud_tuples: Iterable[Tuple[str, Union[
+    sky_clouds.Cloud, ModuleType]]], workspace: str) -> Dict[str, str]:
+    """Returns the cache keys of the clouds whose results can be cached."""
+    # Results for SSH, Kubernetes and Slurm depend on the live state of each
+    # context, so they are never cached.
+    cacheable_clouds = {
+        cloud_repr: cloud
+        for cloud_repr, cloud in cloud_tuples
+        if not getattr(cloud, 'HAS_CONTEXTS', False)
+    }
+    if not cacheable_clouds:
+        return {}
+    # Computed once, as to_dict() copies the whole config.
+    config_repr = repr(skypilot_config.to_dict())
+
+    def _get_cache_key(cloud: Union[sky_clouds.Cloud, ModuleType]) -> str:
+        # The active workspace is thread-local, so set it again for the
+        # worker thread.
+        with skypilot_config.local_active_workspace_ctx(workspace):
+            return _credential_check_cache_key(cloud, config_repr)
+
+    # Listing the credential files may spawn a subprocess (e.g. for AWS), so
+    # compute the keys in parallel.
+    cache_keys = subprocess_utils.run_in_parallel(
+        _get_cache_key,
+        list(cacheable_clouds.values()),
+        num_threads=min(len(cacheable_clouds), _MAX_CREDENTIAL_CHECK_THREADS))
+    return dict(zip(cacheable_clouds, cache_keys))
+
+
+def _get_cached_credential_check(
+        cache_path: str,
+        cache_key: str) -> Optional[Tuple[bool, Optional[str]]]:
+    try:
+        if (time.time() - os.path.getmtime(cache_path) >
+                _CREDENTIAL_CHECK_CACHE_TTL_SECONDS):
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['key'] != cache_key:
+            return None
+        return cached['ok'], cached['reason']
+    except (OSError, ValueError, TypeError, KeyError):
+        return None
+
+
+def _set_cached_credential_check(cache_path: str, cache_key: str, ok: bool,
+                                 reason: Optional[str]) -> None:
+    tmp_path = None
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        # Write to a temporary file and then move it to the final location,
+        # so that concurrent readers never see a partially written file.
+        with tempfile.NamedTemporaryFile('w',
+                                         dir=os.path.dirname(cache_path),
+                                         delete=False,
+                                         encoding='utf-8') as tmp_file:
+            tmp_path = tmp_file.name
+            json.dump({'key': cache_key, 'ok': ok, 'reason': reason}, tmp_file)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug(f'Failed to cache credential check result: {e}')
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
+def _get_all_clouds() -> Tuple[str, ...]:
+    return tuple([repr(c) for c in registry.CLOUD_REGISTRY.values()] +
+                 [cloudflare.NAME, coreweave.NAME])
+
+
+def _get_cloud_tuple(
+        cloud_name: str) -> Tuple[str, Union[sky_clouds.Cloud, ModuleType]]:
+    # Validates cloud_name and returns a tuple of the cloud's name and
+    # the cloud object. Includes special handling for Cloudflare and
+    # CoreWeave. Cloud names are case-insensitive, so lower them to bound
+    # the cache to the registered names and aliases.
+    return _get_cloud_tuple_lower(cloud_name.lower())
+
+
+# Cached, as it is called for every checked and every allowed cloud name.
+@annotations.lru_cache(scope='global', maxsize=64)
+def _get_cloud_tuple_lower(
+        cloud_name: str) -> Tuple[str, Union[sky_clouds.Cloud, ModuleType]]:
+    if cloud_name.startswith('cloudflare'):
+        return cloudflare.NAME, cloudflare
+    elif cloud_name.startswith('coreweave'):
+        return coreweave.NAME, coreweave
+    else:
+        cloud_obj = registry.CLOUD_REGISTRY.from_str(cloud_name)
+        assert cloud_obj is not None, f'Cloud {cloud_name!r} not found'
+        return repr(cloud_obj), cloud_obj
+
+
+@annotations.lru_cache(scope='global', maxsize=16)
+def _get_sorted_cloud_names(cloud_names: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Keyed on the configured names rather than on the config file, as the
+    # config can also come from env vars or per-request overrides.
+    return tuple(sorted(_get_cloud_tuple(c)[0] for c in cloud_names))
+
 
 def _get_workspace_allowed_clouds(workspace: str) -> List[str]:
     # Use allowed_clouds from config if it exists, otherwise check all
     # clouds. Also validate names with get_cloud_tuple.
     config_allowed_cloud_names = skypilot_config.get_nested(
-        ('allowed_clouds',),
-        [repr(c) for c in registry.CLOUD_REGISTRY.values()] +
-        [cloudflare.NAME, coreweave.NAME])
+        ('allowed_clouds',), list(_get_all_clouds()))
     # filter out the clouds that are disabled in the workspace config
     workspace_disabled_clouds = []
     for cloud in config_allowed_cloud_names:
@@ -107,10 +282,6 @@ def check_capabilities(
         capabilities = sky_cloud.ALL_CAPABILITIES
     assert capabilities is not None
 
-    def get_all_clouds() -> Tuple[str, ...]:
-        return tuple([repr(c) for c in registry.CLOUD_REGISTRY.values()] +
-                     [cloudflare.NAME, coreweave.NAME])
-
     def _execute_check_logic_for_workspace(
         current_workspace_name: str,
         hide_per_cloud_details: bool,
@@ -118,8 +289,10 @@ def check_capabilities(
     ) -> Dict[str, List[sky_cloud.CloudCapability]]:
         nonlocal echo, verbose, clouds, quiet
 
-        enabled_clouds: Dict[str, List[sky_cloud.CloudCapability]] = {}
-        disabled_clouds: Dict[str, List[sky_cloud.CloudCapability]] = {}
+        enabled_clouds: Dict[str, List[sky_cloud.CloudCapability]] = (
+            collections.defaultdict(list))
+        disabled_clouds: Dict[str, List[sky_cloud.CloudCapability]] = (
+            collections.defaultdict(list))
 
         def check_one_cloud_one_capability(
             payload: Tuple[Tuple[str, Union[sky_clouds.Cloud, ModuleType]],
@@ -134,50 +307,50 @@ def check_capabilities(
                     current_workspace_name):
                 # Have to override again for specific thread, as the
                 # local_active_workspace_ctx is thread-local.
-                _, cloud = cloud_tuple
+                cloud_repr, cloud = cloud_tuple
+                cache_key = cache_keys.get(cloud_repr)
+                cache_path = _credential_check_cache_path(
+                    cloud_repr, capability, current_workspace_name)
+                if cache_key is not None:
+                    cached_result = _get_cached_credential_check(
+                        cache_path, cache_key)
+                    if cached_result is not None:
+                        return (capability, *cached_result)
                 try:
                     ok, reason = cloud.check_credentials(capability)
                 except exceptions.NotSupportedError:
                     return None
-                except Exception:  # pylint: disable=broad-except
-                    ok, reason = False, traceback.format_exc()
+                except Exception as e:  # pylint: disable=broad-except
+                    # Formatting the full traceback reads the source files
+                    # of every frame, so only do it when it will be shown.
+                    if verbose:
+                        # pylint: disable=import-outside-toplevel
+                        import traceback
+                        reason = traceback.format_exc()
+                    else:
+                        reason = f'{type(e).__name__}: {e}'
+                    ok = False
                 if not isinstance(reason, dict):
                     reason = reason.strip() if reason else None
+                # Only cache successful checks: a failure can be fixed by the
+                # user at any time (e.g. with `aws sso login`), which the
+                # cache key cannot detect.
+                if cache_key is not None and ok and not isinstance(
+                        reason, dict):
+                    _set_cached_credential_check(cache_path, cache_key, ok,
+                                                 reason)
                 return (capability, ok, reason)
 
-        def get_cloud_tuple(
-                cloud_name: str
-        ) -> Tuple[str, Union[sky_clouds.Cloud, ModuleType]]:
-            # Validates cloud_name and returns a tuple of the cloud's name and
-            # the cloud object. Includes special handling for Cloudflare and
-            # CoreWeave.
-            if cloud_name.lower().startswith('cloudflare'):
-                return cloudflare.NAME, cloudflare
-            elif cloud_name.lower().startswith('coreweave'):
-                return coreweave.NAME, coreweave
-            else:
-                cloud_obj = registry.CLOUD_REGISTRY.from_str(cloud_name)
-                assert cloud_obj is not None, f'Cloud {cloud_name!r} not found'
-                return repr(cloud_obj), cloud_obj
-
-        if clouds is not None:
-            cloud_list = clouds
-            check_explicit = True
-        else:
-            cloud_list = get_all_clouds()
-            check_explicit = False
-
-        clouds_to_check = [get_cloud_tuple(c) for c in cloud_list]
-
         # Use allowed_clouds from config if it exists, otherwise check all
-        # clouds. Also validate names with get_cloud_tuple.
-        config_allowed_cloud_names = sorted([
-            get_cloud_tuple(c)[0] for c in skypilot_config.get_nested((
-                'allowed_clouds',), get_all_clouds())
-        ])
+        # clouds. Also validate names with _get_cloud_tuple.
+        config_allowed_cloud_names = list(
+            _get_sorted_cloud_names(
+                tuple(
+                    skypilot_config.get_nested(('allowed_clouds',),
+                                               _get_all_clouds()))))
 
         # filter out the clouds that are disabled in the workspace config
-        workspace_disabled_clouds = []
+        workspace_disabled_clouds: Set[str] = set()
         workspace_cloud_capabilities: Dict[
             str, List[sky_cloud.CloudCapability]] = {}
         for cloud in config_allowed_cloud_names:
@@ -185,7 +358,7 @@ def check_capabilities(
                 cloud, workspace=current_workspace_name)
             cloud_disabled = cloud_config.get('disabled', False)
             if cloud_disabled:
-                workspace_disabled_clouds.append(cloud)
+                workspace_disabled_clouds.add(cloud)
             else:
                 specified_capabilities = _get_workspace_cloud_capabilities(
                     current_workspace_name, cloud)
@@ -202,8 +375,7 @@ def check_capabilities(
                     for capability in capabilities:
                         if capability not in workspace_cloud_capabilities[
                                 cloud]:
-                            disabled_clouds.setdefault(cloud,
-                                                       []).append(capability)
+                            disabled_clouds[cloud].append(capability)
 
         config_allowed_cloud_names = [
             c for c in config_allowed_cloud_names
@@ -211,20 +383,55 @@ def check_capabilities(
         ]
         global_user_state.set_allowed_clouds(
             [c for c in config_allowed_cloud_names], current_workspace_name)
+        # Keep the sorted list for display, and use a set for lookups.
+        config_allowed_cloud_names_set = frozenset(config_allowed_cloud_names)
+
+        if clouds is not None:
+            cloud_list = clouds
+            check_explicit = True
+        else:
+            # Only resolve the clouds that are allowed, as the others would
+            # be skipped below anyway.
+            cloud_list = [
+                c for c in _get_all_clouds()
+                if c in config_allowed_cloud_names_set
+            ]
+            check_explicit = False
+
+        clouds_to_check = [_get_cloud_tuple(c) for c in cloud_list]
 
         # Use disallowed_cloud_names for logging the clouds that will be
         # disabled because they are not included in allowed_clouds in
         # config.yaml.
         disallowed_cloud_names = [
-            c for c in get_all_clouds() if c not in config_allowed_cloud_names
+            c for c in _get_all_clouds()
+            if c not in config_allowed_cloud_names_set
         ]
 
+        if not config_allowed_cloud_names and not check_explicit:
+            # No cloud is allowed, so there is nothing to check: disable all
+            # clouds for this workspace.
+            global_user_state.set_enabled_clouds_bulk(
+                {capability: [] for capability in capabilities},
+                current_workspace_name)
+            echo(
+                _summary_message({}, {}, current_workspace_name,
+                                 hide_workspace_str, disallowed_cloud_names))
+            return {}
+
         combinations = []
         for c in clouds_to_check:
-            allowed = c[0] in config_allowed_cloud_names
+            allowed = c[0] in config_allowed_cloud_names_set
             if allowed or check_explicit:
                 for capability in workspace_cloud_capabilities.get(
                         c[0], capabilities):
+                    # Skip the capabilities the cloud does not support, which
+                    # would only raise NotSupportedError in the worker. A
+                    # disallowed cloud is not checked at all, so all its
+                    # capabilities are reported as disabled.
+                    if (allowed and isinstance(c[1], sky_clouds.Cloud) and
+                            not c[1].supports_capability(capability)):
+                        continue
                     combinations.append((c, capability, allowed))
 
         cloud2ctx2text: Dict[str, Dict[str, str]] = {}
@@ -235,34 +442,79 @@ def check_capabilities(
         with rich_utils.safe_status(
                 ux_utils.spinner_message(
                     f'Checking infra choices{workspace_str}...')):
+            # The cache is only used by the implicit (quiet) refreshes of all
+            # clouds: an explicit `sky check`, or a recheck of specific
+            # clouds, always re-checks the credentials, so that fixes made by
+            # the user are picked up immediately.
+            cache_disabled = (
+                env_options.Options.DISABLE_CREDENTIAL_CHECK_CACHE.get())
+            cache_keys: Dict[str, str] = {}
+            if quiet and clouds is None and not cache_disabled:
+                cache_keys = _get_credential_check_cache_keys(
+                    dict(c for c, _, _ in combinations).items(),
+                    current_workspace_name)
+            # The checks are I/O bound (cloud SDK calls, subprocesses and
+            # file stats) and run in threads, so the concurrency is not
+            # capped by the CPU count, only by a fixed thread limit.
             check_results = subprocess_utils.run_in_parallel(
-                check_one_cloud_one_capability, combinations)
-
-        check_results_dict: Dict[
-            Tuple[str, Union[sky_clouds.Cloud, ModuleType]],
-            List[Tuple[sky_cloud.CloudCapability, bool,
-                       Optional[Union[str, Dict[str, str]]]]]] = (
-                           collections.defaultdict(list))
-        for combination, check_result in zip(combinations, check_results):
+                check_one_cloud_one_capability,
+                combinations,
+                num_threads=min(len(combinations),
+                                _MAX_CREDENTIAL_CHECK_THREADS))
+
+        # Keyed by the cloud's name, with the cloud objects kept in a
+        # separate dict.
+        check_results_dict: Dict[str, List[_CheckResult]] = (
+            collections.defaultdict(list))
+        cloud_repr_to_cloud: Dict[str, Union[sky_clouds.Cloud, ModuleType]] = {}
+        for (cloud_tuple, _, _), check_result in zip(combinations,
+                                                     check_results):
             if check_result is None:
                 continue
             capability, ok, ctx2text = check_result
-            cloud_tuple, _, _ = combination
             cloud_repr = cloud_tuple[0]
             if isinstance(ctx2text, dict):
                 cloud2ctx2text[cloud_repr] = ctx2text
             if ok:
-                enabled_clouds.setdefault(cloud_repr, []).append(capability)
+                enabled_clouds[cloud_repr].append(capability)
             else:
-                disabled_clouds.setdefault(cloud_repr, []).append(capability)
-            check_results_dict[cloud_tuple].append(check_result)
+                disabled_clouds[cloud_repr].append(capability)
+            check_results_dict[cloud_repr].append(check_result)
+            cloud_repr_to_cloud[cloud_repr] = cloud_tuple[1]
 
         if not hide_per_cloud_details:
-            for cloud_tuple, check_result_list in sorted(
-                    check_results_dict.items(), key=lambda item: item[0][0]):
-                _print_checked_cloud(echo, verbose, cloud_tuple,
-                                     check_result_list,
-                                     cloud2ctx2text.get(cloud_tuple[0], {}))
+            for cloud_repr, check_result_list in sorted(
+                    check_results_dict.items(), key=operator.itemgetter(0)):
+                _print_checked_cloud(
+                    echo, verbose,
+                    (cloud_repr, cloud_repr_to_cloud[cloud_repr]),
+                    check_result_list, cloud2ctx2text.get(cloud_repr, {}))
+
+        # Cloudflare and CoreWeave are not real clouds in
+        # registry.CLOUD_REGISTRY, and should not be inserted into the DB
+        # (otherwise `sky launch` and other code would error out when it's
+        # trying to look it up in the registry).
+        def _is_registry_cloud(cloud: str) -> bool:
+            return (not cloud.startswith('Cloudflare') and
+                    not cloud.startswith('CoreWeave'))
+
+        # Build the per-capability sets in a single pass over the results.
+        capability_to_enabled_clouds: Dict[
+            sky_cloud.CloudCapability, Set[str]] = collections.defaultdict(set)
+        capability_to_disabled_clouds: Dict[
+            sky_cloud.CloudCapability, Set[str]] = collections.defaultdict(set)
+        for clouds_dict, capability_to_clouds in (
+            (enabled_clouds, capability_to_enabled_clouds),
+            (disabled_clouds, capability_to_disabled_clouds)):
+            for cloud, cloud_capabilities in clouds_dict.items():
+                if not _is_registry_cloud(cloud):
+                    continue
+                for capability in cloud_capabilities:
+                    capability_to_clouds[capability].add(cloud)
+        config_allowed_clouds_set = {
+            cloud for cloud in config_allowed_cloud_names_set
+            if _is_registry_cloud(cloud)
+        }
 
         # Determine the set of enabled clouds: (previously enabled clouds +
         # newly enabled clouds - newly disabled clouds) intersected with
@@ -270,47 +522,32 @@ def check_capabilities(
         # This means that if a cloud is already enabled and is not included in
         # allowed_clouds in config.yaml, it will be disabled.
         all_enabled_clouds: Set[str] = set()
+        capability_to_enabled_clouds_for_db: Dict[sky_cloud.CloudCapability,
+                                                  List[str]] = {}
         for capability in capabilities:
-            # Cloudflare and CoreWeave are not real clouds in
-            # registry.CLOUD_REGISTRY, and should not be inserted into the DB
-            # (otherwise `sky launch` and other code would error out when it's
-            # trying to look it up in the registry).
-            enabled_clouds_set = {
-                cloud for cloud, capabilities in enabled_clouds.items()
-                if capability in capabilities and not cloud.startswith(
-                    'Cloudflare') and not cloud.startswith('CoreWeave')
-            }
-            disabled_clouds_set = {
-                cloud for cloud, capabilities in disabled_clouds.items()
-                if capability in capabilities and not cloud.startswith(
-                    'Cloudflare') and not cloud.startswith('CoreWeave')
-            }
-            config_allowed_clouds_set = {
-                cloud for cloud in config_allowed_cloud_names
-                if not cloud.startswith('Cloudflare') and
-                not cloud.startswith('CoreWeave')
-            }
             previously_enabled_clouds_set = {
                 repr(cloud)
                 for cloud in global_user_state.get_cached_enabled_clouds(
                     capability, current_workspace_name)
             }
             enabled_clouds_for_capability = (config_allowed_clouds_set & (
-                (previously_enabled_clouds_set | enabled_clouds_set) -
-                disabled_clouds_set))
+                (previously_enabled_clouds_set |
+                 capability_to_enabled_clouds[capability]) -
+                capability_to_disabled_clouds[capability]))
 
-            global_user_state.set_enabled_clouds(
-                list(enabled_clouds_for_capability), capability,
-                current_workspace_name)
-            all_enabled_clouds = all_enabled_clouds.union(
+            capability_to_enabled_clouds_for_db[capability] = list(
                 enabled_clouds_for_capability)
+            all_enabled_clouds |= enabled_clouds_for_capability
+        # Write all capabilities in one transaction.
+        global_user_state.set_enabled_clouds_bulk(
+            capability_to_enabled_clouds_for_db, current_workspace_name)
 
         echo(
             _summary_message(enabled_clouds, cloud2ctx2text,
                              current_workspace_name, hide_workspace_str,
                              disallowed_cloud_names))
 
-        return enabled_clouds
+        return dict(enabled_clouds)
 
     # --- Main check_capabilities logic ---
 
@@ -449,7 +686,7 @@ def get_cached_enabled_clouds_or_refresh(
         with ux_utils.print_exception_no_traceback():
             raise exceptions.NoCloudAccessError(
                 'Cloud access is not set up. Run: '
-                f'{colorama.Style.BRIGHT}sky check{colorama.Style.RESET_ALL}')
+                f'{_BRIGHT}sky check{_RESET_ALL}')
     return cached_enabled_clouds
 
 
@@ -465,30 +702,53 @@ def get_cloud_credential_file_mounts(
     # enabled clouds because users may have partial credentials for some
     # clouds to access their specific resources (e.g. cloud storage) but
     # not have the complete credentials to pass sky check.
-    clouds = registry.CLOUD_REGISTRY.values()
+    clouds: List[Union[sky_clouds.Cloud, ModuleType]] = [
+        cloud for cloud in registry.CLOUD_REGISTRY.values()
+        if excluded_clouds is None or
+        not sky_clouds.cloud_in_iterable(cloud, excluded_clouds)
+    ]
+    active_workspace = skypilot_config.get_active_workspace()
+
+    def _get_existing_credential_file_mounts(
+            cloud: Union[sky_clouds.Cloud, ModuleType]) -> Dict[str, str]:
+        if isinstance(cloud, ModuleType):
+            # Currently, get_cached_enabled_clouds_or_refresh() does not
+            # support r2 (and similarly CoreWeave storage) as only clouds
+            # with computing instances are marked as enabled by skypilot.
+            # This will be removed when cloudflare/r2 is added as a 'cloud'.
+            storage_is_enabled, _ = cloud.check_storage_credentials()
+            if not storage_is_enabled:
+                return {}
+            return cloud.get_credential_file_mounts()
+        # The active workspace is thread-local, so set it again for the
+        # worker thread.
+        with skypilot_config.local_active_workspace_ctx(active_workspace):
+            cloud_file_mounts = cloud.get_credential_file_mounts()
+        return {
+            remote_path: os.path.realpath(os.path.expanduser(local_path))
+            for remote_path, local_path in cloud_file_mounts.items()
+            if os.path.exists(os.path.expanduser(local_path))
+        }
+
+    def _get_existing_credential_file_mounts_in_context(
+        payload: Tuple[Union[sky_clouds.Cloud, ModuleType], contextvars.Context]
+    ) -> Dict[str, str]:
+        cloud, ctx = payload
+        return ctx.run(_get_existing_credential_file_mounts, cloud)
+
+    # Each cloud may stat its config files or spawn a subprocess, so query
+    # them, together with the Cloudflare and CoreWeave storage checks, in
+    # parallel. Worker threads do not inherit the caller's contextvars (e.g.
+    # the per-request config), so run each query in a copy of them; a copy
+    # can only be entered by one thread at a time, hence one per cloud.
+    clouds += [cloudflare, coreweave]
+    payloads = [(cloud, contextvars.copy_context()) for cloud in clouds]
     file_mounts = {}
-    for cloud in clouds:
-        if (excluded_clouds is not None and
-                sky_clouds.cloud_in_iterable(cloud, excluded_clouds)):
-            continue
-        cloud_file_mounts = cloud.get_credential_file_mounts()
-        for remote_path, local_path in cloud_file_mounts.items():
-            if os.path.exists(os.path.expanduser(local_path)):
-                file_mounts[remote_path] = os.path.realpath(
-                    os.path.expanduser(local_path))
-    # Currently, get_cached_enabled_clouds_or_refresh() does not support r2 as
-    # only clouds with computing instances are marked as enabled by skypilot.
-    # This will be removed when cloudflare/r2 is added as a 'cloud'.
-    r2_is_enabled, _ = cloudflare.check_storage_credentials()
-    if r2_is_enabled:
-        r2_credential_mounts = cloudflare.get_credential_file_mounts()
-        file_mounts.update(r2_credential_mounts)
-
-    # Similarly, handle CoreWeave storage credentials
-    coreweave_is_enabled, _ = coreweave.check_storage_credentials()
-    if coreweave_is_enabled:
-        coreweave_credential_mounts = coreweave.get_credential_file_mounts()
-        file_mounts.update(coreweave_credential_mounts)
+    for cloud_file_mounts in subprocess_utils.run_in_parallel(
+            _get_existing_credential_file_mounts_in_context,
+            payloads,
+            num_threads=min(len(payloads), _MAX_CREDENTIAL_CHECK_THREADS)):
+        file_mounts.update(cloud_file_mounts)
     return file_mounts
 
 
@@ -511,71 +771,81 @@ def _print_checked_cloud(
         cloud_capabilities: The capabilities for the cloud.
     """
 
-    def _yellow_color(str_to_format: str) -> str:
-        return (f'{colorama.Fore.LIGHTYELLOW_EX}'
-                f'{str_to_format}'
-                f'{colorama.Style.RESET_ALL}')
-
     cloud_repr, cloud = cloud_tuple
+    # Cloudflare and CoreWeave are modules without the attribute.
+    has_contexts = getattr(cloud, 'HAS_CONTEXTS', False)
     # Print the capabilities for the cloud.
     # consider cloud enabled if any capability is enabled.
     enabled_capabilities: List[sky_cloud.CloudCapability] = []
-    hints_to_capabilities: Dict[str, List[sky_cloud.CloudCapability]] = {}
-    reasons_to_capabilities: Dict[str, List[sky_cloud.CloudCapability]] = {}
+    hints_to_capabilities: Dict[str, List[sky_cloud.CloudCapability]] = (
+        collections.defaultdict(list))
+    reasons_to_capabilities: Dict[str, List[sky_cloud.CloudCapability]] = (
+        collections.defaultdict(list))
     for capability, ok, reason in cloud_capabilities:
         if ok:
             enabled_capabilities.append(capability)
         # `dict` reasons for K8s and SSH will be printed in detail in
         # _format_enabled_cloud. Skip here unless the cloud is disabled.
         if not isinstance(reason, str):
-            if not ok and isinstance(
-                    cloud_tuple[1],
-                (sky_clouds.SSH, sky_clouds.Kubernetes, sky_clouds.Slurm)):
+            if not ok and has_contexts:
                 if reason is not None:
                     reason_str = _format_context_details(cloud_tuple[1],
                                                          show_details=True,
                                                          ctx2text=reason)
                     reason_str = '\n'.join(
                         '    ' + line for line in reason_str.splitlines())
-                    reasons_to_capabilities.setdefault(reason_str,
-                                                       []).append(capability)
+                    reasons_to_capabilities[reason_str].append(capability)
             continue
         if ok:
             if reason is not None:
-                hints_to_capabilities.setdefault(reason, []).append(capability)
+                hints_to_capabilities[reason].append(capability)
         elif reason is not None:
-            reasons_to_capabilities.setdefault(reason, []).append(capability)
-    style_str = f'{colorama.Style.DIM}'
+            reasons_to_capabilities[reason].append(capability)
+    style_str = _DIM
     status_msg: str = 'disabled'
     capability_string: str = ''
     detail_string: str = ''
     activated_account: Optional[str] = None
     if enabled_capabilities:
-        style_str = f'{colorama.Fore.GREEN}{colorama.Style.NORMAL}'
+        style_str = f'{_GREEN}{_NORMAL}'
         status_msg = 'enabled'
         capability_string = f'[{", ".join(enabled_capabilities)}]'
         if verbose and cloud is not cloudflare and cloud is not coreweave:
             activated_account = cloud.get_active_user_identity_str()
-        if isinstance(
-                cloud_tuple[1],
-            (sky_clouds.SSH, sky_clouds.Kubernetes, sky_clouds.Slurm)):
+        if has_contexts:
             detail_string = _format_context_details(cloud_tuple[1],
                                                     show_details=True,
                                                     ctx2text=ctx2text)
-    echo(
+    # Print all lines with a single echo call.
+    lines = [
         click.style(
             f'{style_str}  {cloud_repr}: {status_msg} {capability_string}'
-            f'{colorama.Style.RESET_ALL}{detail_string}'))
+            f'{_RESET_ALL}{detail_string}')
+    ]
     if activated_account is not None:
-        echo(f'    Activated account: {activated_account}')
+        lines.append(f'    Activated account: {activated_account}')
     for reason, capabilities in hints_to_capabilities.items():
-        echo(f'    Hint [{", ".join(capabilities)}]: {_yellow_color(reason)}')
+        lines.append(
+            f'    Hint [{", ".join(capabilities)}]: {_yellow_color(reason)}')
     for reason, capabilities in reasons_to_capabilities.items():
-        echo(f'    Reason [{", ".join(capabilities)}]: {reason}')
+        lines.append(f'    Reason [{", ".join(capabilities)}]: {reason}')
+    echo('\n'.join(lines))
+
+
+def _yellow_color(str_to_format: str) -> str:
+    return f'{_YELLOW}{str_to_format}{_RESET_ALL}'
 
 
 def _green_color(str_to_format: str) -> str:
-    return f'{colorama.Fore.GREEN}{str_to_format}{colorama.Style.RESET_ALL}'
+    return f'{_GREEN}{str_to_format}{_RESET_ALL}'
+
+
+def _red_color(str_to_format: str) -> str:
+    return f'{_RED}{str_to_format}{_RESET_ALL}'
+
+
+def _dim_color(str_to_format: str) -> str:
+    return f'{_DIM}{str_to_format}{_RESET_ALL}'
 
 
 def _format_context_details(cloud: Union[str, sky_clouds.Cloud],
@@ -596,28 +866,23 @@ def _format_context_details(cloud: Union[str, sky_clouds.Cloud],
         assert isinstance(cloud_type, sky_clouds.Kubernetes)
         contexts = sky_clouds.Kubernetes.existing_allowed_contexts()
 
-    filtered_contexts = []
-    for context in contexts:
-        if not show_details:
-            # Skip
-            if (ctx2text is None or context not in ctx2text or
-                    'disabled' in ctx2text[context]):
-                continue
-        filtered_contexts.append(context)
+    if show_details:
+        filtered_contexts = list(contexts)
+    elif ctx2text is None:
+        filtered_contexts = []
+    else:
+        # Only show the enabled contexts.
+        enabled_contexts = {
+            context for context, text in ctx2text.items()
+            if 'disabled' not in text
+        }
+        filtered_contexts = [
+            context for context in contexts if context in enabled_contexts
+        ]
 
     if not filtered_contexts:
         return ''
 
-    def _red_color(str_to_format: str) -> str:
-        return (f'{colorama.Fore.LIGHTRED_EX}'
-                f'{str_to_format}'
-                f'{colorama.Style.RESET_ALL}')
-
-    def _dim_color(str_to_format: str) -> str:
-        return (f'{colorama.Style.DIM}'
-                f'{str_to_format}'
-                f'{colorama.Style.RESET_ALL}')
-
     # For SSH, determine which contexts are disabled due to allowed_node_pools
     disabled_due_to_allowed_node_pools = set()
     if isinstance(cloud_type, sky_clouds.SSH):
@@ -656,11 +921,11 @@ def _format_context_details(cloud: Union[str, sky_clouds.Cloud],
                                               'configuration.'))
                 else:
                     # Default case - not set up
-                    text_suffix = (': ' + _red_color('disabled. ') + _dim_color(
-                        'Reason: Not set up. Use '
-                        '`sky ssh up --infra '
-                        f'{common_utils.removeprefix(context, "ssh-")}` '
-                        'to set up.'))
+                    text_suffix = (': ' + _red_color('disabled. ') +
+                                   _dim_color('Reason: Not set up. Use '
+                                              '`sky ssh up --infra '
+                                              f'{cleaned_context}` '
+                                              'to set up.'))
         contexts_formatted.append(
             f'\n    {symbol}{cleaned_context}{text_suffix}')
     if isinstance(cloud_type, sky_clouds.SSH):
@@ -687,14 +952,10 @@ def _format_enabled_cloud(cloud_name: str,
     cloud_and_capabilities = f'{cloud_name} [{", ".join(capabilities)}]'
     title = _green_color(cloud_and_capabilities)
 
-    if cloud_name in [
-            repr(sky_clouds.Kubernetes()),
-            repr(sky_clouds.SSH()),
-            repr(sky_clouds.Slurm())
-    ]:
+    if getattr(_get_cloud_tuple(cloud_name)[1], 'HAS_CONTEXTS', False):
         return (f'{title}' + _format_context_details(
             cloud_name, show_details=False, ctx2text=ctx2text))
-    return _green_color(cloud_and_capabilities)
+    return title
 
 
 def _summary_message(
@@ -711,7 +972,7 @@ def _summary_message(
             _format_enabled_cloud(cloud, capabilities,
                                   cloud2ctx2text.get(cloud, None))
             for cloud, capabilities in sorted(enabled_clouds.items(),
-                                              key=lambda item: item[0])
+                                              key=operator.itemgetter(0))
         ])
 
     workspace_str = f' for workspace: {current_workspace_name!r}'
@@ -730,8 +991,8 @@ def _summary_message(
             f'{disable_for_workspace_hint}: '
             f'{", ".join([c for c in disallowed_cloud_names])}')
 
-    return (f'\n{colorama.Fore.GREEN}{PARTY_POPPER_EMOJI} '
+    return (f'\n{_GREEN}{PARTY_POPPER_EMOJI} '
             f'Enabled infra{workspace_str} '
             f'{PARTY_POPPER_EMOJI}'
-            f'{colorama.Style.RESET_ALL}{enabled_clouds_str}'
+            f'{_RESET_ALL}{enabled_clouds_str}'
             f'{disallowed_clouds_hint}')
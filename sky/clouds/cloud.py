@@ -148,6 +148,9 @@ class Cloud:
         resources_utils.NetworkTier.STANDARD, resources_utils.NetworkTier.BEST
     }
     _SUPPORTS_SERVICE_ACCOUNT_ON_REMOTE = False
+    # Whether the cloud is made up of multiple contexts (e.g. Kubernetes
+    # contexts or Slurm clusters), whose status is reported per context.
+    HAS_CONTEXTS = False
 
     # The version of provisioner and status query. This is used to determine
     # the code path to use for each cloud in the backend.
@@ -520,6 +523,32 @@ class Cloud:
             return cls._check_storage_credentials()
         assert_never(cloud_capability)
 
+    @classmethod
+    def supports_capability(cls, cloud_capability: CloudCapability) -> bool:
+        """Returns whether this cloud may support the capability.
+
+        This is a cheap check that does not touch any credentials: a cloud
+        is considered to support a capability if it overrides the
+        corresponding credential check. Clouds that override
+        check_credentials() directly are assumed to support all
+        capabilities.
+        """
+
+        def _overrides(method_name: str) -> bool:
+            # Find the class in the MRO that defines the method.
+            for klass in cls.__mro__:
+                if method_name in vars(klass):
+                    return klass is not Cloud
+            return False
+
+        if _overrides('check_credentials'):
+            return True
+        if cloud_capability == CloudCapability.COMPUTE:
+            return _overrides('_check_compute_credentials')
+        elif cloud_capability == CloudCapability.STORAGE:
+            return _overrides('_check_storage_credentials')
+        assert_never(cloud_capability)
+
     @classmethod
     def _check_compute_credentials(
             cls) -> Tuple[bool, Optional[Union[str, Dict[str, str]]]]:
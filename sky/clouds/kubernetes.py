@@ -63,6 +63,8 @@ class Kubernetes(clouds.Cloud):
 
     _SUPPORTS_SERVICE_ACCOUNT_ON_REMOTE = True
 
+    HAS_CONTEXTS = True
+
     _DEFAULT_NUM_VCPUS = 2
     _DEFAULT_NUM_VCPUS_WITH_GPU = 4
     _DEFAULT_MEMORY_CPU_RATIO = 1
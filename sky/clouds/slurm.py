@@ -29,6 +29,7 @@ class Slurm(clouds.Cloud):
     """Slurm."""
 
     _REPR = 'Slurm'
+    HAS_CONTEXTS = True
     _CLOUD_UNSUPPORTED_FEATURES = {
         clouds.CloudImplementationFeatures.AUTOSTOP: 'Slurm does not '
                                                      'support autostop.',
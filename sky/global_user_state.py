@@ -2182,6 +2182,15 @@ def get_cached_enabled_clouds(cloud_capability: 'cloud.CloudCapability',
 def set_enabled_clouds(enabled_clouds: List[str],
                        cloud_capability: 'cloud.CloudCapability',
                        workspace: str) -> None:
+    set_enabled_clouds_bulk({cloud_capability: enabled_clouds}, workspace)
+
+
+@_init_db
+@metrics_lib.time_me
+def set_enabled_clouds_bulk(enabled_clouds: Dict['cloud.CloudCapability',
+                                                 List[str]],
+                            workspace: str) -> None:
+    """Sets the enabled clouds for multiple capabilities in one transaction."""
     assert _SQLALCHEMY_ENGINE is not None
     with orm.Session(_SQLALCHEMY_ENGINE) as session:
         if (_SQLALCHEMY_ENGINE.dialect.name ==
@@ -2192,13 +2201,14 @@ def set_enabled_clouds(enabled_clouds: List[str],
             insert_func = postgresql.insert
         else:
             raise ValueError('Unsupported database dialect')
-        insert_stmnt = insert_func(config_table).values(
-            key=_get_enabled_clouds_key(cloud_capability, workspace),
-            value=json.dumps(enabled_clouds))
-        do_update_stmt = insert_stmnt.on_conflict_do_update(
-            index_elements=[config_table.c.key],
-            set_={config_table.c.value: json.dumps(enabled_clouds)})
-        session.execute(do_update_stmt)
+        for cloud_capability, clouds_for_capability in enabled_clouds.items():
+            insert_stmnt = insert_func(config_table).values(
+                key=_get_enabled_clouds_key(cloud_capability, workspace),
+                value=json.dumps(clouds_for_capability))
+            do_update_stmt = insert_stmnt.on_conflict_do_update(
+                index_elements=[config_table.c.key],
+                set_={config_table.c.value: json.dumps(clouds_for_capability)})
+            session.execute(do_update_stmt)
         session.commit()
 
 
@@ -31,6 +31,9 @@ class Options(enum.Enum):
     # config.
     ALLOW_ALL_KUBERNETES_CONTEXTS = ('SKYPILOT_ALLOW_ALL_KUBERNETES_CONTEXTS',
                                      False)
+    # Disable the on-disk cache of per-cloud credential check results, so
+    # that every credential check calls into the cloud SDK.
+    DISABLE_CREDENTIAL_CHECK_CACHE = ('SKYPILOT_DISABLE_CREDCHECK_CACHE', False)
 
     def __init__(self, env_var: str, default: bool) -> None:
         super().__init__()
@@ -131,7 +131,7 @@ def run_in_parallel(func: Callable,
     if len(args) == 0:
         return []
     if len(args) == 1:
-        return [func(list(args)[0])]
+        return [func(next(iter(args)))]
 
     processes = (num_threads
                  if num_threads is not None else get_parallel_threads())
@@ -1,4 +1,5 @@
 """Unit tests for `sky check` output formatting from sky/check.py."""
+import contextvars
 import re
 from unittest import mock
 
@@ -11,6 +12,15 @@ from sky.client.cli import command
 from sky.clouds import cloud as sky_cloud
 from sky.clouds.cloud import CloudCapability
 from sky.utils import config_utils
+from sky.utils import registry
+
+
+@pytest.fixture(autouse=True)
+def _isolate_credential_check_cache(monkeypatch, tmp_path):
+    """Keeps the tests from reading or writing the user's check cache."""
+    monkeypatch.setenv('SKYPILOT_DISABLE_CREDCHECK_CACHE', '1')
+    monkeypatch.setattr(sky_check, '_CREDENTIAL_CHECK_CACHE_DIR',
+                        str(tmp_path / 'credcheck'))
 
 
 def strip_ansi(s: str) -> str:
@@ -272,6 +282,8 @@ def _mock_k8s_env(monkeypatch,
                         lambda *args, **kwargs: [])
     monkeypatch.setattr('sky.global_user_state.set_enabled_clouds',
                         lambda *args, **kwargs: None)
+    monkeypatch.setattr('sky.global_user_state.set_enabled_clouds_bulk',
+                        lambda *args, **kwargs: None)
     monkeypatch.setattr('sky.global_user_state.set_allowed_clouds',
                         lambda *args, **kwargs: None)
 
@@ -472,3 +484,197 @@ def test_enabled_capabilities_detection():
                     workspace=None,
                 )
                 assert 'AWS' not in capabilities_result['default']
+
+
+def test_credential_check_cache(monkeypatch, tmp_path):
+    """Quiet checks reuse cached successful credential check results."""
+    monkeypatch.setattr(sky_check, '_CREDENTIAL_CHECK_CACHE_DIR', str(tmp_path))
+    monkeypatch.delenv('SKYPILOT_DISABLE_CREDCHECK_CACHE', raising=False)
+    monkeypatch.delenv('AWS_PROFILE', raising=False)
+    monkeypatch.setattr(sky_clouds.AWS, 'get_credential_file_mounts',
+                        lambda self: {})
+
+    def _check(quiet=True, clouds=None):
+        return sky_check.check_capabilities(
+            quiet=quiet,
+            clouds=clouds,
+            capabilities=[CloudCapability.COMPUTE],
+            workspace=None,
+        )
+
+    with mock.patch('sky.skypilot_config._get_loaded_config',
+                    return_value=config_utils.Config(
+                        {'allowed_clouds': ['aws']})):
+        with mock.patch('sky.clouds.aws.AWS._check_compute_credentials',
+                        return_value=(True, None)) as mock_check:
+            for _ in range(2):
+                capabilities_result = _check()
+                assert capabilities_result['default']['AWS'] == [
+                    CloudCapability.COMPUTE
+                ]
+            assert mock_check.call_count == 1
+
+            # A change of the identity env vars invalidates the cached result,
+            # which is overwritten rather than kept next to the new one.
+            monkeypatch.setenv('AWS_PROFILE', 'other')
+            _check()
+            assert mock_check.call_count == 2
+            assert len(list(tmp_path.iterdir())) == 1
+
+            # An explicit (non-quiet) check bypasses the cache, and so does a
+            # recheck of specific clouds; neither computes the cache keys.
+            with mock.patch.object(
+                    sky_check,
+                    '_get_credential_check_cache_keys') as mock_get_keys:
+                _check(quiet=False)
+                assert mock_check.call_count == 3
+                _check(clouds=('aws',))
+                assert mock_check.call_count == 4
+            mock_get_keys.assert_not_called()
+
+            monkeypatch.setenv('SKYPILOT_DISABLE_CREDCHECK_CACHE', '1')
+            _check()
+            assert mock_check.call_count == 5
+
+    # Failed checks are never cached.
+    monkeypatch.setattr(sky_check, '_CREDENTIAL_CHECK_CACHE_DIR',
+                        str(tmp_path / 'failed'))
+    monkeypatch.delenv('SKYPILOT_DISABLE_CREDCHECK_CACHE')
+    with mock.patch('sky.skypilot_config._get_loaded_config',
+                    return_value=config_utils.Config(
+                        {'allowed_clouds': ['aws']})):
+        with mock.patch('sky.clouds.aws.AWS._check_compute_credentials',
+                        return_value=(False, 'no credentials')) as mock_check:
+            for _ in range(2):
+                assert not _check()['default']
+            assert mock_check.call_count == 2
+
+
+def test_credential_check_cache_write_failure(monkeypatch, tmp_path):
+    """A failed cache write leaves no temporary file behind."""
+
+    def _raise(*_args, **_kwargs):
+        raise OSError('read-only')
+
+    monkeypatch.setattr(sky_check.os, 'replace', _raise)
+    cache_path = str(tmp_path / 'AWS-compute.json')
+    sky_check._set_cached_credential_check(cache_path, 'key', True, None)
+    assert not list(tmp_path.iterdir())
+
+
+def test_supports_capability():
+    """supports_capability reflects the implemented credential checks."""
+    assert sky_clouds.AWS.supports_capability(CloudCapability.COMPUTE)
+    assert sky_clouds.AWS.supports_capability(CloudCapability.STORAGE)
+    assert sky_clouds.RunPod.supports_capability(CloudCapability.COMPUTE)
+    assert not sky_clouds.RunPod.supports_capability(CloudCapability.STORAGE)
+
+
+def test_ssh_context_details_strip_only_prefix(monkeypatch):
+    """Only the literal 'ssh-' prefix is removed from SSH context names."""
+    monkeypatch.setattr(sky_clouds.SSH, 'get_ssh_node_pool_contexts',
+                        staticmethod(lambda: ['ssh-hsh']))
+    monkeypatch.setattr(sky_clouds.SSH, 'existing_allowed_contexts',
+                        staticmethod(lambda: ['ssh-hsh']))
+    details = strip_ansi(
+        sky_check._format_context_details(sky_clouds.SSH(),
+                                          show_details=True,
+                                          ctx2text={}))
+    assert '└── hsh: disabled.' in details
+    assert '`sky ssh up --infra hsh`' in details
+
+
+def _stub_cloud_credential_file_mounts(monkeypatch):
+    """Keeps the registry clouds from looking at the real credentials."""
+    for cloud in registry.CLOUD_REGISTRY.values():
+        monkeypatch.setattr(type(cloud), 'get_credential_file_mounts',
+                            lambda self: {})
+
+
+def test_cloud_credential_file_mounts_storage_only_clouds(monkeypatch):
+    """Storage-only credentials are mounted only when they are enabled."""
+    _stub_cloud_credential_file_mounts(monkeypatch)
+    monkeypatch.setattr(sky_check.cloudflare, 'check_storage_credentials',
+                        lambda: (True, None))
+    monkeypatch.setattr(sky_check.coreweave, 'check_storage_credentials',
+                        lambda: (False, 'not set up'))
+    file_mounts = sky_check.get_cloud_credential_file_mounts(
+        excluded_clouds=None)
+    for path in sky_check.cloudflare.get_credential_file_mounts():
+        assert file_mounts[path] == path
+    for path in sky_check.coreweave.get_credential_file_mounts():
+        assert path not in file_mounts
+
+
+def test_cloud_credential_file_mounts_keep_contextvars(monkeypatch):
+    """Each cloud is queried with the caller's contextvars."""
+    request_var = contextvars.ContextVar('request_var', default=None)
+    seen_values = []
+
+    def _get_credential_file_mounts():
+        seen_values.append(request_var.get())
+        return {}
+
+    _stub_cloud_credential_file_mounts(monkeypatch)
+    monkeypatch.setattr(sky_clouds.AWS, 'get_credential_file_mounts',
+                        lambda self: _get_credential_file_mounts())
+    monkeypatch.setattr(sky_clouds.GCP, 'get_credential_file_mounts',
+                        lambda self: _get_credential_file_mounts())
+    request_var.set('request-1')
+    sky_check.get_cloud_credential_file_mounts(excluded_clouds=None)
+    assert seen_values == ['request-1', 'request-1']
+
+
+def test_check_capabilities_no_allowed_clouds():
+    """No credential is checked when allowed_clouds is empty."""
+    with mock.patch('sky.skypilot_config._get_loaded_config',
+                    return_value=config_utils.Config({'allowed_clouds': []})), \
+            mock.patch('sky.clouds.aws.AWS._check_compute_credentials',
+                       return_value=(True, None)) as mock_check, \
+            mock.patch('sky.global_user_state.set_allowed_clouds'), \
+            mock.patch('sky.global_user_state.set_enabled_clouds_bulk'
+                      ) as mock_set_enabled:
+        capabilities_result = sky_check.check_capabilities(
+            quiet=True,
+            capabilities=[CloudCapability.COMPUTE],
+            workspace=None,
+        )
+    assert capabilities_result == {'default': {}}
+    mock_check.assert_not_called()
+    mock_set_enabled.assert_called_once_with({CloudCapability.COMPUTE: []},
+                                             'default')
+
+
+def test_check_capabilities_disallowed_cloud_all_capabilities(capsys):
+    """An explicitly checked disallowed cloud lists all its capabilities."""
+    with mock.patch('sky.skypilot_config._get_loaded_config',
+                    return_value=config_utils.Config(
+                        {'allowed_clouds': ['aws']})), \
+            mock.patch('sky.global_user_state.set_allowed_clouds'), \
+            mock.patch('sky.global_user_state.set_enabled_clouds_bulk'):
+        sky_check.check_capabilities(
+            clouds=('runpod',),
+            capabilities=[CloudCapability.COMPUTE, CloudCapability.STORAGE],
+            workspace=None,
+        )
+    output = strip_ansi(capsys.readouterr().out)
+    assert ('[compute, storage]: RunPod is not included in allowed_clouds'
+            in output)
+
+
+@pytest.mark.parametrize('verbose', [False, True])
+def test_check_capabilities_exception_reason(capsys, verbose):
+    """Full tracebacks of failed checks are only shown in verbose mode."""
+    with mock.patch('sky.skypilot_config._get_loaded_config',
+                    return_value=config_utils.Config()), \
+            mock.patch('sky.clouds.aws.AWS._check_compute_credentials',
+                       side_effect=RuntimeError('boom')):
+        sky_check.check_capabilities(
+            verbose=verbose,
+            clouds=('aws',),
+            capabilities=[CloudCapability.COMPUTE],
+            workspace=None,
+        )
+    out = strip_ansi(capsys.readouterr().out)
+    assert 'RuntimeError: boom' in out
+    assert ('Traceback (most recent call last)' in out) == verbose